@@ -15,9 +15,16 @@ gespeichert. Bereits verarbeitete Bildpfade werden in einer Logdatei
 
 """
 
-import json
+import bisect
+import functools
 import os
+import queue
 import re
+import shutil
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import (
     Tk, Label, Entry, Button, Checkbutton, IntVar,
@@ -25,16 +32,137 @@ from tkinter import (
 )
 from PIL import Image, ImageTk
 
+# PyTurboJPEG ist optional: libjpeg-turbo dekodiert JPEGs schneller als der
+# Decoder von PIL und kann direkt beim Dekodieren verkleinern. Fehlt das
+# Modul oder die native Bibliothek, wird nur PIL verwendet.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _tj = TurboJPEG()
+except Exception:
+    _tj = None
+
+# orjson ist optional und deutlich schneller als das json-Modul der
+# Standardbibliothek. Beide Varianten liefern bzw. erwarten UTF-8-Bytes und
+# schreiben kompakt ohne Einrückung (kleiner und schneller zu serialisieren;
+# eine Zeile pro Objekt, wie es das Journal braucht).
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialisiere obj kompakt in eine Zeile."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        """Serialisiere obj kompakt in eine Zeile."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
 # Basisverzeichnis des Skripts; dort werden die JSON- und Logdatei angelegt.
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# BASE_DIR in POSIX-Form mit abschließendem Schrägstrich (für make_relative).
+_BASE_PREFIX = os.path.abspath(BASE_DIR).replace("\\", "/").rstrip("/") + "/"
+
 # Dateiname für die gesammelten Tagging-Daten (als Liste von Einträgen).
 JSON_FILE = os.path.join(BASE_DIR, "datasheet.json")
 
+# Erlaubte Zeichen für die Foundry-Modul-ID (nur a-z und '-').
+_MODULE_ID_RE = re.compile(r"[a-z-]+")
+
+# Übersetzungstabelle für Label-Vorschläge: Unterstriche/Bindestriche -> Leerzeichen.
+_UND = str.maketrans({"_": " ", "-": " "})
+
+# Dateiendungen (kleingeschrieben), die als Bilddateien erkannt werden.
+IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp"})
+
+# Dateiendungen, die (falls verfügbar) mit TurboJPEG dekodiert werden.
+_JPEG_EXTS = frozenset({".jpg", ".jpeg"})
+
+# Dateifilter für den Auswahldialog, aus IMG_EXTS abgeleitet.
+_IMG_FILETYPES = [("Bilddateien", tuple(f"*{ext}" for ext in sorted(IMG_EXTS)))]
+
+# Maximale Größe der Vorschaubilder (Breite, Höhe) in Pixeln.
+PREVIEW_SIZE = (250, 250)
+
+# Filter zum Verkleinern der Vorschau. Image.Resampling gibt es erst ab
+# Pillow 9.1; Pillow-SIMD (schnellere Drop-in-Variante) ist älter.
+_PREVIEW_RESAMPLE = getattr(Image, "Resampling", Image).BILINEAR
+
+# Anzahl der Folgebilder, deren Vorschau im Hintergrund vorbereitet wird.
+PREFETCH_COUNT = 2
+
+# Maximale Anzahl verkleinerter Vorschaubilder im LRU-Cache.
+PREVIEW_CACHE_SIZE = 32
+
+# Intervall (ms), in dem fertig dekodierte Vorschaubilder abgeholt werden.
+PREVIEW_POLL_MS = 15
+
+# Eine beim Start nicht lesbare JSON-Datei wird vor dem Überschreiben hierhin
+# kopiert (bei vorhandener Sicherung mit Zähler: .defekt.1, .defekt.2, ...).
+JSON_DAMAGED_FILE = JSON_FILE + ".defekt"
+
+# Journal (JSON Lines) mit allen Einträgen, die seit dem letzten vollständigen
+# Schreiben von JSON_FILE gespeichert wurden. Pro Speichern wird genau eine
+# Zeile angehängt; beim Beenden wird JSON_FILE neu geschrieben und das Journal
+# geleert.
+JSONL_FILE = os.path.join(BASE_DIR, "datasheet.jsonl")
+
+# Marker, den write_data vor dem Ersetzen von JSON_FILE anlegt: Länge des
+# übernommenen Journals (Bytes) und Anzahl der Einträge in der neuen JSON-Datei.
+# Bricht das Programm zwischen os.replace und dem Löschen des Journals ab,
+# erkennt _load_data daran, dass das Journal bereits enthalten ist.
+JSONL_MERGED_FILE = JSONL_FILE + ".merged"
+
+# Ein Journal mit unlesbaren Zeilen wird nicht einfach gelöscht, sondern
+# hierhin gesichert, damit die Zeilen notfalls von Hand gerettet werden können.
+JSONL_DAMAGED_FILE = JSONL_FILE + ".defekt"
+
 # Logdatei, die relative Pfade bereits verarbeiteter Bilder enthält.
 LOG_FILE = os.path.join(BASE_DIR, "processed_log.txt")
 
 
+# Verfügbare Tag-Gruppen als (gruppenname, spalten, tag-optionen).
+# "spalten" legt fest, wie viele Checkbuttons pro Zeile der Gruppe angezeigt
+# werden, um das Layout zu glätten. Die Struktur ist fest kodiert und wird
+# nur einmal beim Import angelegt.
+_TAGS = (
+    ("category", 2, (
+        "humanoid", "aberrant", "aquatic", "bestial", "constructed", "divine",
+        "draconic", "elemental", "fey", "fiendish", "fungal", "monitor",
+        "planar", "plant", "undead"
+    )),
+    ("ancestry", 3, (
+        "dwarf", "elf", "gnome", "goblin", "halfling", "human", "leshy", "orc",
+        "amurrun", "azarketi", "fetchling", "hobgoblin", "iruxi", "kholo",
+        "kitsune", "kobold", "nagaji", "tengu", "tripkee", "vanara", "ysoki",
+        "anadi", "android", "automaton", "conrasu", "fleshwarp", "ghoran",
+        "goloma", "kashrishi", "poppet", "shisk", "shoony", "skeleton",
+        "sprite", "strix", "vishkanya", "aiuvarin", "beastkin", "changeling",
+        "dhampir", "dromaar", "geniekin", "nephilim"
+    )),
+    ("equipment", 2, (
+        "axe", "bludgeon", "bomb", "bow", "brawling", "crossbow", "dart",
+        "firearm", "flail", "knife", "pick", "polearm", "shield", "sling",
+        "sword", "tome", "scroll", "focus", "unarmored", "clothing",
+        "light", "medium", "heavy"
+    )),
+    ("features", 2, (
+        "magic", "music", "alchemy", "companion", "dual-wielding",
+        "prosthetic", "nature", "tech", "winged"
+    )),
+    ("family", 2, (
+        "civilian", "warrior", "sage", "seafarer", "officer", "outcast",
+        "worker", "artisan", "affluent"
+    )),
+    ("special", 2, ("bust", "unique", "iconic", "deity")),
+)
+
+
 def normalize_path(path: str) -> str:
     """
     Normalisiere einen Pfad in POSIX-Form.
@@ -44,13 +172,68 @@ def normalize_path(path: str) -> str:
     return Path(path).as_posix()
 
 
+def decode_preview(path: str) -> Image.Image:
+    """
+    Öffne ein Bild und verkleinere es auf PREVIEW_SIZE.
+
+    Image.draft erlaubt dem JPEG-Decoder, direkt in reduzierter Auflösung
+    (1/2, 1/4, 1/8) zu dekodieren; bei anderen Formaten hat es keine Wirkung.
+    Ist TurboJPEG verfügbar, werden JPEGs damit dekodiert (_decode_turbojpeg).
+    Für die Vorschau genügt BILINEAR statt des teureren Standardfilters LANCZOS.
+    Die Funktion fasst keine Tk-Objekte an und kann daher in einem
+    Hintergrund-Thread laufen.
+    """
+    img = None
+    if _tj is not None and os.path.splitext(path)[1].lower() in _JPEG_EXTS:
+        try:
+            img = _decode_turbojpeg(path)
+        except Exception:
+            # z. B. CMYK- oder beschädigte JPEGs: PIL versuchen lassen
+            img = None
+    if img is None:
+        img = Image.open(path)
+        # draft wählt die stärkste Reduktion, bei der das Bild noch mindestens
+        # PREVIEW_SIZE groß ist; BILINEAR verkleinert danach höchstens um Faktor 2
+        img.draft("RGB", PREVIEW_SIZE)
+    img.thumbnail(PREVIEW_SIZE, _PREVIEW_RESAMPLE)  # beschränkt Auflösung und Speicher
+    return img
+
+
+def _decode_turbojpeg(path: str) -> Image.Image:
+    """
+    Dekodiere ein JPEG mit TurboJPEG und nutze dabei den kleinsten
+    Skalierungsfaktor (höchstens 1), bei dem das Bild noch mindestens so
+    groß bleibt wie das spätere Thumbnail (analog zu Image.draft).
+    """
+    with open(path, "rb") as f:
+        buf = f.read()
+    width, height = _tj.decode_header(buf)[:2]
+    # Faktor, mit dem thumbnail das Bild in PREVIEW_SIZE einpassen wird;
+    # wie bei draft und thumbnail wird nie vergrößert
+    needed = min(1.0, PREVIEW_SIZE[0] / width, PREVIEW_SIZE[1] / height)
+    factor = min(
+        (sf for sf in _tj.scaling_factors
+         if sf[0] <= sf[1] and sf[0] / sf[1] >= needed),
+        key=lambda sf: sf[0] / sf[1],
+        default=(1, 1)
+    )
+    return Image.fromarray(_tj.decode(buf, pixel_format=TJPF_RGB, scaling_factor=factor))
+
+
+@functools.lru_cache(maxsize=4096)
 def make_relative(path: str) -> str:
     """
     Erzeuge einen Pfad relativ zum Skript-Ordner und normalisiere ihn.
 
     Das erleichtert portables Speichern von Bildpfaden in der JSON-Datei,
     da beim Verschieben des Projektordners relative Pfade erhalten bleiben.
+    Die Ergebnisse werden zwischengespeichert, da pro Speichern dieselben
+    Pfade mehrfach umgerechnet werden. Liegt der Pfad unterhalb von BASE_DIR
+    (der Normalfall), genügt es, das Präfix abzuschneiden.
     """
+    p = os.path.abspath(path).replace("\\", "/")
+    if p.startswith(_BASE_PREFIX):
+        return p[len(_BASE_PREFIX):]
     return normalize_path(os.path.relpath(path, BASE_DIR))
 
 
@@ -104,7 +287,7 @@ class ModuleIDDialog:
         Schließt das Fenster bei gültiger Eingabe.
         """
         value = self.result.get().strip()
-        if not re.fullmatch(r"[a-z-]+", value):
+        if not _MODULE_ID_RE.fullmatch(value):
             messagebox.showerror(
                 "Ungültige Eingabe",
                 "Die Modul-ID darf nur Kleinbuchstaben und Bindestriche enthalten."
@@ -142,6 +325,9 @@ class ImageTagger:
             root.destroy()
             return
 
+        # Präfix für Foundry-kompatible Pfade: /modules/<module_id>/<relativer Pfad>
+        self._foundry_prefix = f"/modules/{self.module_id}/"
+
         self.root = root
         self.root.title("PF2e Character Gallery Tagger")
         self.root.geometry("1260x1000")
@@ -151,21 +337,53 @@ class ImageTagger:
         self.current_folder = None        # Ordner, aus dem Bilder geladen werden
         self.image_files = []             # Liste aller Bildpfade im aktuellen Ordner
         self.current_index = -1           # Index des aktuell geladenen Bilds in image_files
-        self.saved_count = 0              # Anzahl gespeicherter Einträge (aus JSON)
+        self.saved_count = 0              # Anzahl gespeicherter Einträge (len(data))
+        self.data = []                    # Alle Einträge (einmalig aus JSON geladen)
+        self._data_dirty = False          # True, wenn data noch nicht in JSON_FILE steht
+        self._json_damaged = False        # True, wenn JSON_FILE nicht gelesen werden konnte
+        self._journal_damaged = False     # True, wenn das Journal unlesbare Zeilen enthält
+        self._journal_torn = False        # True, wenn die letzte Journalzeile unvollständig ist
         self.image1_preview = None        # Referenz auf PhotoImage für Vorschaubild 1
         self.image2_preview = None        # Referenz auf PhotoImage für Vorschaubild 2
 
+        # Hintergrund-Threads zum Dekodieren der Vorschaubilder. Der LRU-Cache
+        # bildet (Pfad, mtime) -> Future (mit verkleinertem PIL-Bild) ab, damit
+        # vorgeladene und erneut gewählte Bilder nicht neu dekodiert werden;
+        # PhotoImages selbst dürfen nur im Tk-Thread erzeugt werden.
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._preview_cache = OrderedDict()
+        # Noch laufende Vorschau-Jobs: number -> (Future, Pfad). Ein neuer Job
+        # für dasselbe Label ersetzt den alten, dessen Ergebnis dann verfällt.
+        self._pending_previews = {}
+        self._poll_job = None             # after()-ID von _poll_previews
+
         # Gelernte/verarbeitete Pfade aus der Logdatei laden
         self.processed_paths = self._load_processed_paths()
 
+        # Logdatei einmalig öffnen und gepuffert beschreiben. Journal- und
+        # Logeinträge schreibt ein eigener Thread (_io_worker), damit
+        # save_and_next nicht auf die Platte warten muss. Beide Dateihandles
+        # gehören ab dann ausschließlich diesem Thread.
+        self._log_fh = self._open_log()
+        self._jsonl_fh = None             # Journal-Dateihandle (beim ersten Schreiben geöffnet)
+        self._io_queue = queue.Queue()    # (Eintrag, relativer Pfad oder None); None beendet
+        self._io_errors = queue.Queue()   # (Titel, Meldung) für den Tk-Thread
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
+
         # Aufbau der Benutzeroberfläche und Konfiguration des Wurzel-Layouts
         self._setup_ui()
         self.root.rowconfigure(4, weight=1)
         self.root.columnconfigure(0, weight=1)
 
-        # Anzahl der bereits gespeicherten Einträge ermitteln (für Statusanzeige)
+        # Gespeicherte Einträge einmalig laden; danach wird saved_count nur
+        # noch in save_and_next hochgezählt (für Statusanzeige)
+        self._load_data()
         self.update_saved_count()
 
+        # Beim Schließen des Fensters die gesammelten Daten einmalig schreiben
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     # ------------------------------------------------------------------
     # GUI-Aufbau und Hilfsmethoden
     # ------------------------------------------------------------------
@@ -254,8 +472,9 @@ class ImageTagger:
         self.tags_inner.pack(fill="both", expand=True)
 
         # Tag-Struktur definieren, Variablencontainer vorbereiten und UI bauen
-        self.tags = self.create_tags_structure()
-        self.tag_vars = {}         # dict: gruppe -> {tag_name: IntVar}
+        self.tags = _TAGS
+        self._tag_state = bytearray()  # ein Byte pro Tag: 1 = gewählt
+        self._tag_meta = []        # Tag-Index -> (gruppe, tag_name)
         self.keep_group_vars = {}  # dict: gruppe -> IntVar (Toggle "Tags behalten")
         self._build_tag_checkbuttons()
 
@@ -296,12 +515,16 @@ class ImageTagger:
         die einzelnen Tags und fügt unter jeder Gruppe einen Checkbutton
         hinzu, mit dem das Beibehalten der Tags (für die Gruppe) gesteuert wird.
 
-        Intern werden zwei Mappings gepflegt:
-        - self.tag_vars[group][tag] -> IntVar für jeden Tag
+        Die Auswahl wird in Python geführt, statt je Tag eine IntVar (Tcl-
+        Variable) anzulegen und abzufragen; beim Speichern fallen so keine
+        Tcl-Aufrufe für die Tags an:
+        - self._tag_state[i] -> 1, wenn Tag i gewählt ist, sonst 0
+        - self._tag_meta[i] -> (group, tag) für Tag i
         - self.keep_group_vars[group] -> IntVar für den "Tags behalten"-Toggle
         """
         col = 0  # Spaltenindex für die Gruppen anordnen
-        for cat, options in self.tags.items():
+        reset_groups = []
+        for cat, max_cols, options in self.tags:
             # LabelFrame für die Gruppe (z.B. "Category", "Ancestry")
             lf = LabelFrame(
                 self.tags_inner,
@@ -310,24 +533,25 @@ class ImageTagger:
             )
             lf.grid(row=0, column=col, padx=5, sticky="n")
 
-            # Positionierung der Tag-Checkbuttons innerhalb der Gruppe
-            row_idx = 0
-            col_idx = 0
-            self.tag_vars[cat] = {}
-
-            # Anzahl Spalten innerhalb der Gruppe festlegen, um Layout zu glätten
-            max_cols = 2 if cat in ("category", "features", "family", "special", "equipment") else 3
-
-            for opt in options:
-                var = IntVar()
-                self.tag_vars[cat][opt] = var
-                cb = Checkbutton(lf, text=opt, variable=var)
-                cb.grid(row=row_idx, column=col_idx, sticky="w", padx=2, pady=1)
+            # Tags der Gruppe belegen die Indizes start .. start+len(options)-1
+            start = len(self._tag_meta)
+            cbs = []
+            for i, opt in enumerate(options):
+                self._tag_meta.append((cat, opt))
+                # Eindeutiger Widget-Name, da Tk ohne "variable" eine globale
+                # Tcl-Variable mit dem Namen des Widgets für den Anzeigezustand nutzt
+                cb = Checkbutton(
+                    lf, text=opt, name=f"tag_{cat}_{i}",
+                    command=lambda idx=start + i: self._toggle(idx)
+                )
+                cbs.append(cb)
 
-                col_idx += 1
-                if col_idx >= max_cols:
-                    col_idx = 0
-                    row_idx += 1
+            # Positionierung der Tag-Checkbuttons innerhalb der Gruppe: ein
+            # grid-Aufruf pro Zeile statt pro Checkbutton. Ohne -column legt Tk
+            # die übergebenen Widgets von links nach rechts in Spalte 0, 1, ... ab.
+            for row_idx, first in enumerate(range(0, len(cbs), max_cols)):
+                self._grid_row(cbs[first:first + max_cols], row_idx)
+            row_idx = len(cbs) // max_cols
 
             # Nach den Tag-Checkboxen ein zusätzlicher Checkbutton:
             # "Tags behalten" für diese Gruppe (default: aus)
@@ -338,8 +562,33 @@ class ImageTagger:
             # Spaltenbreite der Gruppe eingenommen
             keep_cb.grid(row=row_idx + 1, column=0, columnspan=max_cols, sticky="w", pady=(5, 0))
 
+            # Für das Zurücksetzen nach dem Speichern vorberechnet:
+            # (Start-/End-Index, Tk-Pfadnamen der Checkbuttons, Keep-Toggle)
+            reset_groups.append(
+                (start, len(self._tag_meta), tuple(str(cb) for cb in cbs), keep_var)
+            )
+
             col += 1
 
+        self._tag_state = bytearray(len(self._tag_meta))
+        self._reset_groups = tuple(reset_groups)
+
+    def _grid_row(self, widgets, row):
+        """
+        Platziert mehrere Widgets mit einem einzigen Tcl-Aufruf in einer
+        Grid-Zeile (Spalten 0..len(widgets)-1).
+        """
+        self.root.tk.call(
+            "grid", *(str(w) for w in widgets),
+            "-row", row, "-sticky", "w", "-padx", 2, "-pady", 1
+        )
+
+    def _toggle(self, idx):
+        """
+        Callback der Tag-Checkbuttons: schaltet den Zustand von Tag idx um.
+        """
+        self._tag_state[idx] ^= 1
+
     # ------------------------------------------------------------------
     # Dateiauswahl und Vorschauladen
     # ------------------------------------------------------------------
@@ -358,7 +607,7 @@ class ImageTagger:
         """
         file_path = filedialog.askopenfilename(
             title="Bilddatei wählen",
-            filetypes=[("Bilddateien", "*.png;*.jpg;*.jpeg;*.bmp;*.gif;*.webp")]
+            filetypes=_IMG_FILETYPES
         )
         if not file_path:
             return
@@ -378,26 +627,33 @@ class ImageTagger:
             self.load_preview(file_path, 1)
 
             # Sammle alle Bilddateien aus dem Ordner für Vor-/Zurück-Navigation
-            self.current_folder = os.path.dirname(os.path.abspath(file_path))
-            all_files = os.listdir(self.current_folder)
-            self.image_files = [
-                os.path.abspath(os.path.join(self.current_folder, f))
-                for f in all_files
-                if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp"))
-            ]
-            self.image_files.sort()
+            # (scandir liefert den Dateityp ohne zusätzlichen stat-Aufruf; nur
+            # bei verlinkten Dateien folgt is_file dem Link per stat).
+            # Der Pfad wird einmal normalisiert (abspath, ohne Symlinks
+            # aufzulösen); alle Pfade werden vom selben Ordner abgeleitet.
+            abs_file_path = os.path.abspath(file_path)
+            self.current_folder = os.path.dirname(abs_file_path)
+            with os.scandir(self.current_folder) as it:
+                self.image_files = sorted(
+                    e.path for e in it
+                    if e.is_file()
+                    and os.path.splitext(e.name)[1].lower() in IMG_EXTS
+                )
 
             # Versuche, den aktuellen Index auf das ausgewählte Bild zu setzen.
-            abs_file_path = os.path.abspath(file_path)
-            try:
-                self.current_index = self.image_files.index(abs_file_path)
-            except ValueError:
-                # Fallback: vergleiche aufgelöste Pfade (resolve)
-                self.current_index = next((i for i, p in enumerate(self.image_files)
-                                           if Path(p).resolve() == Path(abs_file_path).resolve()), 0)
+            # image_files ist sortiert, daher genügt eine binäre Suche.
+            index = bisect.bisect_left(self.image_files, abs_file_path)
+            if index == len(self.image_files) or self.image_files[index] != abs_file_path:
+                # Fallback: nur die Dateinamen vergleichen (alle Bilder liegen
+                # im selben Ordner); normcase gleicht z. B. Groß-/Kleinschreibung
+                # unter Windows an.
+                name = os.path.normcase(os.path.basename(abs_file_path))
+                index = next((i for i, p in enumerate(self.image_files)
+                              if os.path.normcase(os.path.basename(p)) == name), 0)
+            self.current_index = index
 
-            self.update_saved_count()
             self.update_info_label()
+            self._prefetch_previews()
         else:
             # Für Entry 2 nur das Feld füllen und die Vorschau anzeigen
             self.path_entry2.delete(0, "end")
@@ -413,46 +669,121 @@ class ImageTagger:
         - number: 1 oder 2 (entsprechendes Vorschau-Label)
 
         Hinweise:
-        - Es wird PIL.Image verwendet; bei Ladefehler wird eine Fehlermeldung angezeigt.
+        - Öffnen und Verkleinern (decode_preview) laufen im Thread-Pool; das
+          PhotoImage wird in _install_preview im Tk-Thread erzeugt.
         - Für das erste Bild (number == 1) wird außerdem automatisch ein
           Vorschlags-Label aus dem Dateinamen erzeugt (Unterstriche / Bindestriche
           werden durch Leerzeichen ersetzt).
         """
+        if number == 1:
+            # Generiere einen sinnvollen Label-Vorschlag aus dem Dateinamen
+            label_text = os.path.splitext(os.path.basename(path))[0].translate(_UND)
+            self.label_entry.delete(0, "end")
+            self.label_entry.insert(0, label_text)
+
+        # Thumbnail aus dem Cache verwenden, sonst Job starten
+        future = self._preview_future(path)
+
+        if future.done():
+            self._pending_previews.pop(number, None)
+            self._install_preview(future, number)
+        else:
+            # Bis der Job fertig ist, einen Platzhalter statt des alten Bilds zeigen
+            self._pending_previews[number] = (future, path)
+            self._preview_label(number).config(image="", text="Lade…")
+            if self._poll_job is None:
+                self._poll_job = self.root.after(PREVIEW_POLL_MS, self._poll_previews)
+
+    def _poll_previews(self):
+        """
+        Holt im Tk-Thread die fertigen Vorschau-Jobs ab und plant sich erneut
+        ein, solange noch Jobs laufen.
+        """
+        self._poll_job = None
+        for number, (future, _path) in list(self._pending_previews.items()):
+            if future.done():
+                del self._pending_previews[number]
+                self._install_preview(future, number)
+        if self._pending_previews:
+            self._poll_job = self.root.after(PREVIEW_POLL_MS, self._poll_previews)
+
+    def _install_preview(self, future, number):
+        """
+        Erzeugt aus dem Ergebnis eines Vorschau-Jobs das PhotoImage und zeigt
+        es im Label number an. Muss im Tk-Thread laufen.
+        Bei Ladefehlern wird eine Fehlermeldung angezeigt.
+        """
         try:
-            img = Image.open(path)
-            img.thumbnail((250, 250))  # Thumbnail-Größe beschränkt Auflösung und Speicher
-            photo = ImageTk.PhotoImage(img)
-
-            if number == 1:
-                # Referenz speichern, sonst wird das Bild vom Garbage Collector entfernt
-                self.image1_preview = photo
-                self.preview_label1.config(image=self.image1_preview)
-
-                # Generiere einen sinnvollen Label-Vorschlag aus dem Dateinamen
-                basename = os.path.splitext(os.path.basename(path))[0]
-                label_text = basename.replace("_", " ").replace("-", " ")
-                self.label_entry.delete(0, "end")
-                self.label_entry.insert(0, label_text)
-            else:
-                self.image2_preview = photo
-                self.preview_label2.config(image=self.image2_preview)
+            photo = ImageTk.PhotoImage(future.result())
         except Exception as e:
+            self._preview_label(number).config(text="")
             # Fehlermeldung bei Problemen mit dem Dateiformat oder Dateizugriff
             messagebox.showerror("Fehler", f"Bild konnte nicht geladen werden:\n{e}")
+            return
 
-    def clear_input(self, entry):
+        # Referenz speichern, sonst wird das Bild vom Garbage Collector entfernt
+        if number == 1:
+            self.image1_preview = photo
+        else:
+            self.image2_preview = photo
+        self._preview_label(number).config(image=photo, text="")
+
+    def _preview_label(self, number):
         """
-        Löscht den Inhalt eines Entry-Feldes und entfernt die zugehörige Vorschau.
+        Liefert das Vorschau-Label für number (1 oder 2).
+        """
+        return self.preview_label1 if number == 1 else self.preview_label2
 
-        Wird verwendet von den "Clear"-Buttons neben den Pfad-Entries.
+    def _clear_preview(self, number):
+        """
+        Entfernt die Vorschau number und verwirft einen noch laufenden
+        Vorschau-Job für dieses Label.
         """
-        if entry == self.path_entry1:
-            self.preview_label1.config(image="")
+        self._pending_previews.pop(number, None)
+        self._preview_label(number).config(image="", text="")
+        if number == 1:
             self.image1_preview = None
         else:
-            self.preview_label2.config(image="")
             self.image2_preview = None
 
+    def _preview_future(self, path):
+        """
+        Liefert den Vorschau-Job für path aus dem LRU-Cache oder startet einen
+        neuen im Thread-Pool. Schlüssel ist (Pfad, mtime), damit geänderte
+        Dateien neu dekodiert werden; fehlgeschlagene Jobs werden wiederholt.
+        Der Cache hält höchstens PREVIEW_CACHE_SIZE Einträge.
+        """
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            # Datei nicht lesbar: nicht cachen, der Job meldet den Fehler
+            return self._pool.submit(decode_preview, path)
+
+        future = self._preview_cache.get(key)
+        if future is None or future.cancelled() or (future.done() and future.exception()):
+            future = self._pool.submit(decode_preview, path)
+            self._preview_cache[key] = future
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return future
+
+    def _prefetch_previews(self):
+        """
+        Startet das Dekodieren der nächsten PREFETCH_COUNT Bilder im
+        Hintergrund, damit load_preview beim Weiterschalten nicht auf die
+        Festplatte bzw. den Decoder warten muss.
+        """
+        for path in self.image_files[self.current_index + 1:self.current_index + 1 + PREFETCH_COUNT]:
+            self._preview_future(path)
+
+    def clear_input(self, entry):
+        """
+        Löscht den Inhalt eines Entry-Feldes und entfernt die zugehörige Vorschau.
+
+        Wird verwendet von den "Clear"-Buttons neben den Pfad-Entries.
+        """
+        self._clear_preview(1 if entry == self.path_entry1 else 2)
         entry.delete(0, "end")
 
     # ------------------------------------------------------------------
@@ -466,11 +797,15 @@ class ImageTagger:
         1. Pfad 1 und Label prüfen.
         2. Scale einlesen und prüfen.
         3. Tags aus allen Gruppen sammeln.
-        4. JSON-Datei laden (falls vorhanden), neuen Eintrag anhängen und speichern.
-        5. Relativen Pfad des Bildes in die Logdatei schreiben (falls noch nicht vorhanden).
+        4. Eintrag an self.data anhängen.
+        5. Eintrag und relativen Pfad des Bildes (falls noch nicht geloggt) an den
+           Schreib-Thread übergeben, der Journal und Logdatei im Hintergrund schreibt.
         6. Tags für jede Gruppe zurücksetzen, wenn der zugehörige Keep-Toggle deaktiviert ist.
         7. Vorschau und Felder für Bild 2 zurücksetzen und zum nächsten Bild wechseln.
         """
+        # Fehler aus vorherigen Hintergrund-Schreibvorgängen melden
+        self._report_io_errors()
+
         path1 = self.path_entry1.get()
         if not path1:
             messagebox.showwarning("Fehler", "Bitte Bildpfad 1 wählen!")
@@ -497,18 +832,15 @@ class ImageTagger:
 
         # Sammle ausgewählte Tags je Gruppe
         tag_data = {}
-        for cat, options in self.tag_vars.items():
-            selected = [opt for opt, var in options.items() if var.get()]
+        for i, selected in enumerate(self._tag_state):
             if selected:
-                tag_data[cat] = selected
+                cat, opt = self._tag_meta[i]
+                tag_data.setdefault(cat, []).append(opt)
 
-        # Hilfsfunktion: prepend module path to relative path
-        def make_foundry_path(p):
-            """
-            Erzeugt einen Foundry-kompatiblen Pfad, indem der relative Pfad
-            mit /modules/<module_id>/ vorangestellt wird.
-            """
-            return f"/modules/{self.module_id}/{make_relative(p)}"
+        # Foundry-kompatible Pfade: relativer Pfad mit /modules/<module_id>/ davor
+        make = self._foundry_prefix.__add__
+        foundry_path1 = make(make_relative(path1))
+        foundry_path2 = make(make_relative(path2))
 
         # Zusammensetzen des Eintrags für die JSON-Datei.
         # Das Feld "source" ist fest auf "Token Sammlung" gesetzt.
@@ -517,61 +849,50 @@ class ImageTagger:
             "key": key_value,
             "source": "Token Sammlung",
             "art": {
-                "portrait": make_foundry_path(path1),
-                "thumb": make_foundry_path(path1),
-                "token": make_foundry_path(path2),
-                "subject": make_foundry_path(path2),
+                "portrait": foundry_path1,
+                "thumb": foundry_path1,
+                "token": foundry_path2,
+                "subject": foundry_path2,
                 "scale": scale
             },
             "tags": tag_data
         }
 
-        # Vorhandene JSON-Datei laden (falls lesbar), sonst mit leerer Liste starten.
-        data = []
-        if os.path.exists(JSON_FILE):
-            try:
-                with open(JSON_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except json.JSONDecodeError:
-                # Wenn die Datei beschädigt ist, vermeiden wir Absturz; es wird
-                # mit einer neuen Liste weitergearbeitet. Bestehende Datei bleibt unangetastet.
-                data = []
-
-        # Neuen Eintrag anhängen und Datei schreiben.
-        data.append(entry)
-        try:
-            with open(JSON_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except PermissionError:
-            messagebox.showerror("Fehler", f"Keine Schreibrechte für:\n{JSON_FILE}")
-            return
-        except Exception as e:
-            messagebox.showerror("Fehler", f"Beim Schreiben der JSON-Datei ist ein Fehler aufgetreten:\n{e}")
-            return
+        # Eintrag im Speicher anhängen; die vollständige JSON-Datei wird erst
+        # beim Beenden (on_close) geschrieben.
+        self.data.append(entry)
+        self._data_dirty = True
 
-        # Relativen Pfad in die Logdatei hinzufügen (nur wenn noch nicht vorhanden)
-        rel_path = make_relative(path1)
-        if rel_path not in self.processed_paths:
+        # Relativen Pfad für die Logdatei vormerken (nur wenn noch nicht vorhanden)
+        rel_path = sys.intern(make_relative(path1))
+        if rel_path in self.processed_paths:
+            rel_path = None
+        else:
             self.processed_paths.add(rel_path)
-            self._append_to_log(rel_path)
+
+        # Journal- und Logeintrag an den Schreib-Thread übergeben
+        self._io_queue.put((entry, rel_path))
 
         # Anzahl gespeicherter Einträge aktualisieren und Info-Label setzen
         self.saved_count += 1
         self.update_info_label()
 
         # Nur die Gruppen zurücksetzen, deren "Tags behalten"-Toggle deaktiviert ist.
-        # Die Keep-Flags werden in self.keep_group_vars geführt.
-        for cat, options in self.tag_vars.items():
-            keep_flag = self.keep_group_vars.get(cat)
-            if not keep_flag or not keep_flag.get():
-                # Toggle nicht gesetzt: Checkboxen dieser Gruppe zurücksetzen
-                for var in options.values():
-                    var.set(0)
+        # Abgewählt werden nur die tatsächlich gesetzten Checkbuttons, und zwar
+        # alle zusammen mit einem einzigen Tcl-Aufruf.
+        state = self._tag_state
+        to_deselect = []
+        for start, stop, paths, keep_var in self._reset_groups:
+            if not any(state[start:stop]) or keep_var.get():
+                continue
+            to_deselect.extend(p for i, p in enumerate(paths, start) if state[i])
+            state[start:stop] = bytes(stop - start)
+        if to_deselect:
+            self.root.tk.call("foreach", "w", tuple(to_deselect), "$w deselect")
 
         # Bild 2 und seine Vorschau zurücksetzen
         self.path_entry2.delete(0, "end")
-        self.preview_label2.config(image="")
-        self.image2_preview = None
+        self._clear_preview(2)
 
         # Zum nächsten Bild navigieren (falls vorhanden)
         self.load_next_image()
@@ -598,20 +919,18 @@ class ImageTagger:
             self.path_entry1.delete(0, "end")
             self.path_entry1.insert(0, next_path)
             self.load_preview(next_path, 1)
+            self._prefetch_previews()
 
             # Bild 2 und Vorschau zurücksetzen
             self.path_entry2.delete(0, "end")
-            self.preview_label2.config(image="")
-            self.image2_preview = None
+            self._clear_preview(2)
         else:
             # Kein weiteres Bild im Ordner
             messagebox.showinfo("Fertig", "Keine weiteren Bilder im Ordner.")
             self.path_entry1.delete(0, "end")
             self.path_entry2.delete(0, "end")
-            self.preview_label1.config(image="")
-            self.preview_label2.config(image="")
-            self.image1_preview = None
-            self.image2_preview = None
+            self._clear_preview(1)
+            self._clear_preview(2)
             self.label_entry.delete(0, "end")
 
     # ------------------------------------------------------------------
@@ -627,20 +946,173 @@ class ImageTagger:
 
     def update_saved_count(self):
         """
-        Liest die JSON-Datei ein und setzt self.saved_count auf die Anzahl
-        der vorhandenen Einträge. Bei Lesefehlern wird saved_count auf 0 gesetzt.
+        Setzt self.saved_count auf die Anzahl der Einträge in self.data.
+        """
+        self.saved_count = len(self.data)
+
+    def _load_data(self):
         """
-        self.saved_count = 0
-        if os.path.exists(JSON_FILE):
+        Liest die JSON-Datei einmalig ein und hält die Einträge in self.data.
+        Einträge aus dem Journal (z. B. nach einem Absturz vor dem letzten
+        Beenden) werden angehängt. Fehlt JSON_FILE, wird mit einer leeren
+        Liste begonnen. Ist sie vorhanden, aber nicht lesbar oder keine Liste,
+        wird ein Fehler angezeigt; write_data sichert sie dann vor dem
+        Überschreiben nach JSON_DAMAGED_FILE.
+
+        Das Journal wird zeilenweise gelesen: eine unlesbare (z. B. beim
+        Absturz abgeschnittene) Zeile wird übersprungen, ohne die übrigen
+        Einträge zu verwerfen. Enthält der Marker JSONL_MERGED_FILE genau die
+        Anzahl der Einträge in JSON_FILE, ist der vermerkte Teil des Journals
+        bereits übernommen und wird nicht erneut angehängt.
+        """
+        self.data = []
+        try:
+            with open(JSON_FILE, "rb") as f:
+                data = _loads(f.read())
+            # Erwartung: data ist eine Liste von Einträgen
+            if not isinstance(data, list):
+                raise ValueError("Die Datei enthält keine Liste von Einträgen.")
+            self.data = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # Nicht mit einer leeren Liste überschreiben, sonst wären alle
+            # bisherigen Einträge verloren
+            self._json_damaged = True
+            messagebox.showerror(
+                "Fehler",
+                f"Die JSON-Datei konnte nicht gelesen werden:\n{JSON_FILE}\n{e}\n\n"
+                "Vor dem nächsten Speichern wird sie als Sicherung "
+                f"({os.path.basename(JSON_DAMAGED_FILE)}) kopiert."
+            )
+
+        # Noch nicht in JSON_FILE übernommene Einträge aus dem Journal nachladen
+        try:
+            with open(JSONL_FILE, "rb") as f:
+                journal = f.read()
+        except Exception:
+            # Kein oder nicht lesbares Journal: bereits geladene Daten nicht verwerfen
+            return
+        if not journal:
+            return
+        # Eine abgeschnittene letzte Zeile muss vor dem nächsten Anhängen
+        # abgeschlossen werden, sonst verschmilzt sie mit dem neuen Eintrag
+        self._journal_torn = not journal.endswith(b"\n")
+
+        skip = 0
+        try:
+            with open(JSONL_MERGED_FILE, "rb") as f:
+                marker = _loads(f.read())
+            if marker["count"] == len(self.data):
+                skip = marker["size"]
+        except Exception:
+            pass
+
+        pending = []
+        for line in journal[skip:].splitlines():
+            if not line.strip():
+                continue
             try:
-                with open(JSON_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Erwartung: data ist eine Liste von Einträgen
-                    if isinstance(data, list):
-                        self.saved_count = len(data)
+                pending.append(_loads(line))
             except Exception:
-                # Bei Problemen (z. B. beschädigter JSON) verbleibt saved_count bei 0
-                self.saved_count = 0
+                self._journal_damaged = True
+        if pending:
+            self.data.extend(pending)
+        if pending or skip or self._journal_damaged:
+            # JSON_FILE neu schreiben, damit Journal und Marker aufgeräumt werden
+            self._data_dirty = True
+
+    def write_data(self):
+        """
+        Schreibt self.data vollständig in die JSON-Datei und leert danach das
+        Journal, da alle Einträge nun in JSON_FILE enthalten sind. Enthielt
+        das Journal unlesbare Zeilen, wird es nach JSONL_DAMAGED_FILE
+        gesichert statt nur gelöscht. Konnte JSON_FILE beim Start nicht
+        gelesen werden, wird sie vorher nach JSON_DAMAGED_FILE kopiert;
+        schlägt das fehl, wird nichts geschrieben und das Journal bleibt
+        erhalten.
+
+        Geschrieben wird in eine temporäre Datei, die anschließend per
+        os.replace atomar über JSON_FILE gelegt wird. Ein abgebrochener
+        Schreibvorgang hinterlässt so nie eine halb geschriebene JSON-Datei.
+
+        Rückgabe:
+        - True bei Erfolg, sonst False (Fehlermeldung wurde angezeigt)
+        """
+        try:
+            if self._json_damaged:
+                # Unlesbare Datei nie ohne Sicherung ersetzen; eine ältere
+                # Sicherung wird dabei nicht überschrieben
+                backup = JSON_DAMAGED_FILE
+                n = 0
+                while os.path.exists(backup):
+                    n += 1
+                    backup = f"{JSON_DAMAGED_FILE}.{n}"
+                try:
+                    shutil.copy2(JSON_FILE, backup)
+                except FileNotFoundError:
+                    pass
+                self._json_damaged = False
+            # Erst komplett serialisieren und dann in einem Aufruf schreiben;
+            # json.dump würde viele kleine write()-Aufrufe erzeugen.
+            payload = _dumps(self.data)
+            tmp = JSON_FILE + ".tmp"
+            with open(tmp, "wb", buffering=1 << 20) as f:
+                f.write(payload)
+                # Inhalt auf die Platte bringen, bevor die alte Datei ersetzt wird
+                f.flush()
+                os.fsync(f.fileno())
+            # Marker vor dem Ersetzen anlegen, damit ein Abbruch bis zum
+            # Löschen des Journals nicht zu doppelten Einträgen führt
+            try:
+                size = os.path.getsize(JSONL_FILE)
+            except FileNotFoundError:
+                size = 0
+            if size:
+                with open(JSONL_MERGED_FILE, "wb") as f:
+                    f.write(_dumps({"size": size, "count": len(self.data)}))
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, JSON_FILE)
+            if size:
+                if self._journal_damaged:
+                    # An eine evtl. schon vorhandene Sicherung anhängen
+                    with open(JSONL_FILE, "rb") as src, open(JSONL_DAMAGED_FILE, "ab") as dst:
+                        dst.write(src.read())
+                os.remove(JSONL_FILE)
+            try:
+                os.remove(JSONL_MERGED_FILE)
+            except FileNotFoundError:
+                pass
+            self._journal_damaged = False
+            self._journal_torn = False
+        except PermissionError:
+            messagebox.showerror("Fehler", f"Keine Schreibrechte für:\n{JSON_FILE}")
+            return False
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Beim Schreiben der JSON-Datei ist ein Fehler aufgetreten:\n{e}")
+            return False
+        self._data_dirty = False
+        return True
+
+    def on_close(self):
+        """
+        Wird beim Schließen des Hauptfensters aufgerufen. Schreibt die
+        gesammelten Einträge einmalig in die JSON-Datei und beendet die
+        Anwendung. Schlägt das Schreiben fehl, bleibt das Journal erhalten.
+        """
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+        # Schreib-Thread beenden; er schreibt noch alle ausstehenden Einträge
+        # und schließt Journal und Logdatei (vor write_data, damit das
+        # Journal entfernt werden kann)
+        self._io_queue.put(None)
+        self._io_thread.join()
+        self._report_io_errors()
+        if self._data_dirty:
+            self.write_data()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def _load_processed_paths(self):
         """
@@ -650,77 +1122,129 @@ class ImageTagger:
         Rückgabe:
         - Set von Strings (relativer Pfade)
         """
-        if os.path.exists(LOG_FILE):
-            try:
-                with open(LOG_FILE, "r", encoding="utf-8") as f:
-                    return set(line.strip() for line in f if line.strip())
-            except Exception as e:
-                messagebox.showerror(
-                    "Fehler beim Laden des Log-Speichers",
-                    f"Die Logdatei konnte nicht gelesen werden:\n{e}"
-                )
+        try:
+            # Einmal komplett lesen; splitlines entfernt Zeilenenden (auch CRLF).
+            # Internierte Strings machen Hash-Vergleiche zu Identitätsvergleichen.
+            with open(LOG_FILE, "r", encoding="utf-8", buffering=1 << 20) as f:
+                return {sys.intern(line) for line in f.read().splitlines() if line}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror(
+                "Fehler beim Laden des Log-Speichers",
+                f"Die Logdatei konnte nicht gelesen werden:\n{e}"
+            )
         return set()
 
-    def _append_to_log(self, rel_path: str):
+    def _open_log(self):
         """
-        Hängt einen relativen Pfad an die Logdatei an. Bei Fehlern wird eine
-        Fehlermeldung angezeigt, die Anwendung aber nicht zwangsweise beendet.
+        Öffnet die Logdatei im Anhängemodus mit großem Schreibpuffer.
+
+        Rückgabe:
+        - Dateiobjekt oder None, falls die Datei nicht geöffnet werden konnte
         """
         try:
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(rel_path + "\n")
+            return open(LOG_FILE, "a", encoding="utf-8", buffering=1 << 15)
         except Exception as e:
             messagebox.showerror(
                 "Fehler beim Loggen",
-                f"Die Logdatei konnte nicht geschrieben werden:\n{e}"
+                f"Die Logdatei konnte nicht geöffnet werden:\n{e}"
             )
+            return None
 
-    # ------------------------------------------------------------------
-    # Tag-Struktur
-    # ------------------------------------------------------------------
-    def create_tags_structure(self):
+    def _io_worker(self):
         """
-        Definiert die verfügbaren Tag-Gruppen und die jeweiligen Tag-Optionen.
+        Schreib-Thread für Journal und Logdatei.
 
-        Rückgabe:
-        - Dictionary: gruppenname -> Liste von Tag-Strings
-
-        Hinweis:
-        - Diese Struktur ist aktuell fest kodiert. Bei Bedarf kann sie aus
-          einer externen Datei geladen werden, um Anpassungen ohne Codeänderung
-          zu ermöglichen.
-        """
-        return {
-            "category": [
-                "humanoid", "aberrant", "aquatic", "bestial", "constructed", "divine",
-                "draconic", "elemental", "fey", "fiendish", "fungal", "monitor",
-                "planar", "plant", "undead"
-            ],
-            "ancestry": [
-                "dwarf", "elf", "gnome", "goblin", "halfling", "human", "leshy", "orc",
-                "amurrun", "azarketi", "fetchling", "hobgoblin", "iruxi", "kholo",
-                "kitsune", "kobold", "nagaji", "tengu", "tripkee", "vanara", "ysoki",
-                "anadi", "android", "automaton", "conrasu", "fleshwarp", "ghoran",
-                "goloma", "kashrishi", "poppet", "shisk", "shoony", "skeleton",
-                "sprite", "strix", "vishkanya", "aiuvarin", "beastkin", "changeling",
-                "dhampir", "dromaar", "geniekin", "nephilim"
-            ],
-            "equipment": [
-                "axe", "bludgeon", "bomb", "bow", "brawling", "crossbow", "dart",
-                "firearm", "flail", "knife", "pick", "polearm", "shield", "sling",
-                "sword", "tome", "scroll", "focus", "unarmored", "clothing",
-                "light", "medium", "heavy"
-            ],
-            "features": [
-                "magic", "music", "alchemy", "companion", "dual-wielding",
-                "prosthetic", "nature", "tech", "winged"
-            ],
-            "family": [
-                "civilian", "warrior", "sage", "seafarer", "officer", "outcast",
-                "worker", "artisan", "affluent"
-            ],
-            "special": ["bust", "unique", "iconic", "deity"]
-        }
+        Wartet auf Einträge in self._io_queue, holt alle bereits wartenden
+        zusammen ab und schreibt sie mit _write_pending gebündelt. Ein None
+        in der Queue beendet den Thread; vorher werden die Dateien
+        geschlossen. Fehler werden über self._io_errors an den Tk-Thread
+        gemeldet, da messagebox nur dort aufgerufen werden darf.
+        """
+        entries = []
+        log_lines = []
+        running = True
+        while running:
+            items = [self._io_queue.get()]
+            while True:
+                try:
+                    items.append(self._io_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in items:
+                if item is None:
+                    running = False
+                    continue
+                entry, rel_path = item
+                entries.append(entry)
+                # Ohne Logdatei (_open_log schlug fehl) nichts sammeln
+                if rel_path is not None and self._log_fh is not None:
+                    log_lines.append(rel_path)
+            self._write_pending(entries, log_lines)
+
+        if self._jsonl_fh is not None:
+            try:
+                self._jsonl_fh.close()
+            except Exception:
+                pass
+            self._jsonl_fh = None
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except Exception as e:
+                self._io_errors.put((
+                    "Fehler beim Loggen",
+                    f"Die Logdatei konnte nicht geschrieben werden:\n{e}"
+                ))
+            self._log_fh = None
+
+    def _write_pending(self, entries, log_lines):
+        """
+        Schreibt die gesammelten Einträge mit je einem Aufruf in das Journal
+        und die Logdatei (läuft im Schreib-Thread). Erfolgreich geschriebene
+        Listen werden geleert; schlägt das Schreiben fehl, bleiben die
+        Einträge erhalten und werden beim nächsten Aufruf erneut geschrieben.
+        """
+        if entries:
+            try:
+                if self._jsonl_fh is None:
+                    self._jsonl_fh = open(JSONL_FILE, "ab", buffering=1 << 16)
+                    if self._journal_torn:
+                        self._jsonl_fh.write(b"\n")
+                        self._journal_torn = False
+                self._jsonl_fh.write(b"".join(_dumps(e) + b"\n" for e in entries))
+                self._jsonl_fh.flush()
+                entries.clear()
+            except PermissionError:
+                self._io_errors.put(("Fehler", f"Keine Schreibrechte für:\n{JSONL_FILE}"))
+            except Exception as e:
+                self._io_errors.put((
+                    "Fehler",
+                    f"Beim Schreiben der JSON-Datei ist ein Fehler aufgetreten:\n{e}"
+                ))
+
+        if log_lines and self._log_fh is not None:
+            try:
+                self._log_fh.write("\n".join(log_lines) + "\n")
+                self._log_fh.flush()
+                log_lines.clear()
+            except Exception as e:
+                self._io_errors.put((
+                    "Fehler beim Loggen",
+                    f"Die Logdatei konnte nicht geschrieben werden:\n{e}"
+                ))
+
+    def _report_io_errors(self):
+        """
+        Zeigt Fehler des Schreib-Threads an. Muss im Tk-Thread laufen.
+        """
+        while True:
+            try:
+                title, message = self._io_errors.get_nowait()
+            except queue.Empty:
+                return
+            messagebox.showerror(title, message)
 
 
 if __name__ == "__main__":